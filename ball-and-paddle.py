@@ -36,11 +36,13 @@ Q                           Quit
 
 from __future__ import division, print_function, unicode_literals
 
+import atexit
+import functools
+import heapq
 import io
 import math
 import random
 import sys
-import time
 
 import easygui
 import pygame
@@ -55,16 +57,37 @@ if sys.version_info < (3, 3):
 else:
     _NoFile = FileNotFoundError
 
+# The balls move in whole-degree angles most of the time, so looking up
+# sines and cosines from these tables is good enough and a lot faster
+# than calling math.radians(), math.sin() and math.cos() all the time.
+_SIN_DEG = tuple(math.sin(math.radians(angle)) for angle in range(360))
+_COS_DEG = tuple(math.cos(math.radians(angle)) for angle in range(360))
 
-def time2hide(starttime):
-    """A helper function for blinking things.
+# These are created only once instead of creating a new set for every
+# key event.
+_LEFT_KEYS = frozenset([pygame.K_LEFT, pygame.K_a])
+_RIGHT_KEYS = frozenset([pygame.K_RIGHT, pygame.K_d])
+_LAUNCH_KEYS = frozenset([pygame.K_SPACE, pygame.K_RETURN,
+                          pygame.K_UP, pygame.K_w])
 
-    The return value is a Boolean that changes twice per second.
+
+def _random_bits():
+    """Yield random Booleans forever.
+
+    This calls random.getrandbits() only once per 64 Booleans, so it's
+    a lot cheaper than random.choice([True, False]).
     """
-    return (time.time() - starttime) % 1 < 0.5
+    while True:
+        bits = random.getrandbits(64)
+        for _ in range(64):
+            yield bool(bits & 1)
+            bits >>= 1
+
 
+_random_bool = functools.partial(next, _random_bits())
 
-class Ball:
+
+class Ball(object):
     """A ball on the screen.
 
     Ball objects remember their position, movement and they implement
@@ -85,6 +108,12 @@ class Ball:
                   V
     """
 
+    # The game may create lots of balls, and __slots__ makes them use
+    # less memory and makes attribute lookups a bit faster.
+    __slots__ = ['game', 'radius', '_paddle_y', 'x', 'y', 'angle',
+                 'crazy_speed', 'crazy_angle', '_angle_delta', '_speedrange',
+                 '_create_frame', '_blinking', 'is_fake']
+
     RADIUSES = [10, 50]
     NORMAL_ANGLE_DELTA = 2
     CRAZY_ANGLE_DELTA = 20
@@ -97,85 +126,110 @@ class Ball:
         """Initialize the ball."""
         self.game = game
         self.radius = self.RADIUSES[0]
+        self._update_paddle_y()
         self.x = game.width // 2
-        self.y = game.height - Paddle.HEIGHT - self.radius
+        self.y = self._paddle_y
         self.angle = 270
         self.crazy_speed = False
         self.crazy_angle = False
-        self._create_time = time.time()
+        self._update_movement()
+        self._create_frame = game.clock.frames
         self._blinking = False
-        self.is_fake = random.choice([False, False, True])
+        self.is_fake = random.random() < 1/3
 
     def do_random(self):
         """Do crazy things."""
         # Decide how crazy the ball will be.
-        self.crazy_angle = random.choice([True, False])
-        self.crazy_speed = random.choice([True, False])
-        self.radius = random.choice(self.RADIUSES)
-        self._blinking = random.choice([True, False, False])
+        self.crazy_angle = _random_bool()
+        self.crazy_speed = _random_bool()
+        self._update_movement()
+        # There are two radiuses, so a random Boolean works as an index.
+        self.radius = self.RADIUSES[_random_bool()]
+        self._update_paddle_y()
+        self._blinking = random.random() < 1/3
         self.game.do_random()
 
-    def draw(self, surface):
-        """Draw the ball on the surface."""
-        if self._blinking and time2hide(self._create_time):
+    def _update_movement(self):
+        """Call this when crazy_angle or crazy_speed changes."""
+        if self.crazy_angle:
+            self._angle_delta = self.CRAZY_ANGLE_DELTA
+        else:
+            self._angle_delta = self.NORMAL_ANGLE_DELTA
+        if self.crazy_speed:
+            self._speedrange = self.CRAZY_SPEEDRANGE
+        else:
+            self._speedrange = self.NORMAL_SPEEDRANGE
+
+    def _update_paddle_y(self):
+        """Call this when the radius changes."""
+        self._paddle_y = self.game.height - Paddle.HEIGHT - self.radius
+
+    def get_blit(self):
+        """Return a (sprite, position) pair for drawing the ball.
+
+        The pairs are meant to be passed to the screen's blits() method.
+        None is returned if the ball is blinking and currently hidden.
+        """
+        if self._blinking and self.game.clock.time2hide(self._create_frame):
             # Time to hide.
-            return
+            return None
 
+        game = self.game
+        radius = self.radius
         if self.is_fake:
             fill = (127, 127, 127)
-        elif self.game.double_speed:
+        elif game.double_speed:
             fill = (0, 0, 0)
         else:
             fill = (255, 255, 255)
-        coords = [int(self.x), int(self.y)]
-        pygame.draw.circle(surface, fill, coords, self.radius)
-        pygame.draw.circle(surface, (0, 0, 0), coords, self.radius, 1)
+        sprite = game.get_ball_sprite(radius, fill)
+        return (sprite, (int(self.x) - radius - 1, int(self.y) - radius - 1))
 
     def move(self):
-        """Move the ball and change its settings."""
-        if self.game.launched:
-            if self.crazy_angle:
-                delta = self.CRAZY_ANGLE_DELTA
-            else:
-                delta = self.NORMAL_ANGLE_DELTA
-            self.angle += random.randint(-delta, delta)
+        """Move the ball and change its settings.
 
-            if self.crazy_speed:
-                speedrange = self.CRAZY_SPEEDRANGE
-            else:
-                speedrange = self.NORMAL_SPEEDRANGE
-
-            # In this picture, speed is random.randint(*speedrange). It
-            # needs to be calculated once for xdiff and once for ydiff
-            # to make the game is as crazy as possible.
-            #
-            #    xdiff
-            # -----------
-            # \)angle   |
-            #  \        |
-            #   \       |
-            #    \      |
-            #     \     |
-            #      \    | ydiff
-            # speed \   |
-            #        \  |
-            #         \ |
-            #          \|
-            #
-            # sin(angle) = ydiff / speed
-            # ydiff = sin(angle) * speed
-            #
-            # cos(angle) = xdiff / speed
-            # xdiff = cos(angle) * speed
-            angle = math.radians(self.angle)
-            ydiff = math.sin(angle) * random.randint(*speedrange)
-            xdiff = math.cos(angle) * random.randint(*speedrange)
-
-            if self.game.double_speed:
-                xdiff *= 2
-                ydiff *= 2
-            self.x += xdiff
-            self.y += ydiff
+        This must not be called before the ball has been launched.
+        """
+        randint = random.randint
+        delta = self._angle_delta
+        angle = self.angle + randint(-delta, delta)
+        self.angle = angle
+        speedrange = self._speedrange
+
+        # In this picture, speed is random.randint(*speedrange). It
+        # needs to be calculated once for xdiff and once for ydiff
+        # to make the game is as crazy as possible.
+        #
+        #    xdiff
+        # -----------
+        # \)angle   |
+        #  \        |
+        #   \       |
+        #    \      |
+        #     \     |
+        #      \    | ydiff
+        # speed \   |
+        #        \  |
+        #         \ |
+        #          \|
+        #
+        # sin(angle) = ydiff / speed
+        # ydiff = sin(angle) * speed
+        #
+        # cos(angle) = xdiff / speed
+        # xdiff = cos(angle) * speed
+        #
+        # The angle isn't always an integer because paddlespot
+        # isn't, but rounding it doesn't make a visible difference.
+        degrees = int(round(angle)) % 360
+        ydiff = _SIN_DEG[degrees] * randint(*speedrange)
+        xdiff = _COS_DEG[degrees] * randint(*speedrange)
+
+        if self.game.double_speed:
+            xdiff *= 2
+            ydiff *= 2
+        self.x += xdiff
+        self.y += ydiff
 
     def _on_hit(self, side, paddlespot=None):
         """This is ran when the ball hits to the wall or the paddle.
@@ -223,37 +277,49 @@ class Ball:
             self.do_random()
             # do_random() may change the radius, so this needs to be
             # after it.
-            self.y = self.game.height - Paddle.HEIGHT - self.radius
+            self.y = self._paddle_y
 
     def hitcheck(self):
         """Check if the ball hits the paddle or an wall and handle it.
 
-        Call self._on_hit() when needed.
+        Call self._on_hit() when needed. This must not be called before
+        the ball has been launched.
         """
-        if self.x < self.radius:  # Left wall.
+        # The ball can't hit both side walls at the same time, and it
+        # can't be at the top and at the paddle at the same time either,
+        # so elifs are fine.
+        radius = self.radius
+        x = self.x
+        y = self.y
+
+        if x < radius:  # Left wall.
             self._on_hit('a')
-        if self.x > self.game.width - self.radius:  # Right wall.
+        elif x > self.game.width - radius:  # Right wall.
             self._on_hit('d')
-        if self.y < self.radius:  # Top wall.
+
+        if y < radius:  # Top wall.
             self._on_hit('w')
-        if self.y > self.game.height - Paddle.HEIGHT - self.radius:  # Paddle.
-            if self.is_fake:
-                return
+        elif y > self._paddle_y and not self.is_fake:  # Paddle.
+            # Fake balls go through the paddle.
+            paddle = self.game.paddle
 
             # Distance from the paddle's center to the ball's center.
-            paddlespot = self.x - self.game.paddle.x
+            paddlespot = self.x - paddle.x
 
             # Width of an imaginary big paddle to make sure that it's
             # easy to bump the ball with the edge of the paddle.
-            bigpaddle = self.radius + self.game.paddle.width + self.radius
+            bigpaddle = radius + paddle.width + radius
 
             if -bigpaddle//2 < paddlespot < bigpaddle//2:
                 # Now we are sure that the ball hits the paddle.
-                self.game.paddle.do_random()
+                paddle.do_random()
                 self._on_hit('s', paddlespot)
 
 
-class Paddle:
+class Paddle(object):
+
+    __slots__ = ['game', 'x', 'direction', '_flip', '_create_frame',
+                 '_blinking', 'width']
 
     HEIGHT = 25     # from bottom of game to top edge
     WIDTHS = [100, 100, 100, 75, 200]
@@ -266,7 +332,7 @@ class Paddle:
         self.x = game.width // 2
         self.direction = 0  # -1 is left, 1 is right, 0 is not moving.
         self._flip = False  # Turn right to left and left to right.
-        self._create_time = time.time()
+        self._create_frame = game.clock.frames
         self._blinking = False
         self.width = self.WIDTHS[0]
 
@@ -274,23 +340,25 @@ class Paddle:
         """Do crazy things."""
         # The paddle is unlikely to blink, but it happens sometimes.
         self._blinking = random.random() < 0.2
-        self._flip = random.choice([True, False])
+        self._flip = _random_bool()
         self.width = random.choice(self.WIDTHS)
 
-    def draw(self, surface):
-        """Draw the paddle on surface."""
-        if self._blinking and time2hide(self._create_time):
+    def get_blit(self):
+        """Return a (sprite, position) pair for drawing the paddle.
+
+        None is returned if the paddle is blinking and currently hidden.
+        """
+        if self._blinking and self.game.clock.time2hide(self._create_frame):
             # Time to hide.
-            return
+            return None
         if self._flip:
             color = (255, 0, 127)  # pink
         else:
             color = (0, 255, 0)  # green
-        coords = [self.x - self.width//2, self.game.height - self.HEIGHT,
-                  self.width, self.THICKNESS]
-        pygame.draw.rect(surface, color, coords)
-        if self.game.double_speed:
-            pygame.draw.rect(surface, (0, 0, 0), coords, 3)
+        sprite = self.game.get_paddle_sprite(
+            self.width, color, self.game.double_speed)
+        return (sprite, (self.x - self.width//2,
+                         self.game.height - self.HEIGHT))
 
     def move(self):
         """Move the paddle."""
@@ -308,23 +376,45 @@ class Paddle:
             self.x = self.game.width - self.width//2
 
 
+_fonts = {}     # {size: font, ...}
+
+
+def get_font(size):
+    """Return pygame's default font in the given size.
+
+    Loading a font is slow, so each size is loaded only once.
+    """
+    try:
+        return _fonts[size]
+    except KeyError:
+        font = _fonts[size] = pygame.font.Font(None, size)
+        return font
+
+
 def format_time(seconds):
-    hundredths = int(seconds * 100)
-    seconds, hundredths = hundredths // 100, hundredths % 100
-    minutes, seconds = seconds // 60, seconds % 60
+    minutes, hundredths = divmod(int(seconds * 100), 60 * 100)
+    seconds, hundredths = divmod(hundredths, 100)
     return '%02d:%02d:%02d' % (minutes, seconds, hundredths)
 
 
-class Clock:
+class Clock(object):
+
+    __slots__ = ['game', 'time', 'frames', '_font', '_running',
+                 '_frequency', '_clock', '_text_key', '_text']
 
     def __init__(self, game, frequency):
         """Initialize the clock."""
         self.game = game
         self.time = 0
-        self._font = pygame.font.Font(None, 40)  # 40px default font.
+        self.frames = 0     # Number of wait() calls so far.
+        self._font = get_font(40)   # 40px default font.
         self._running = False
         self._frequency = frequency
         self._clock = pygame.time.Clock()
+        # Rendering text is slow, so the previous text is reused when
+        # the clock shows the same thing again.
+        self._text_key = None   # (hundredths, color)
+        self._text = None
 
     def start(self):
         """The ball is launched."""
@@ -345,43 +435,69 @@ class Clock:
         Add 1/frequency to self.time when it's been at least 1/frequency
         seconds since the previous wait.
         """
+        self.frames += 1
         if self._running:
             self.time += 1 / self._frequency
         self._clock.tick(self._frequency)
 
-    def draw(self, surface):
-        """Draw a clock to the upper left corner of surface."""
+    def time2hide(self, start_frame):
+        """A helper method for blinking things.
+
+        The start_frame should be a value of self.frames. The return
+        value is a Boolean that changes twice per second. Counting
+        frames is cheaper than asking the operating system for the time.
+        """
+        half_second = self._frequency // 2
+        return (self.frames - start_frame) % (2*half_second) < half_second
+
+    def get_blit(self):
+        """Return a (text, position) pair for drawing the clock.
+
+        The clock goes to the upper left corner.
+        """
         if self.game.double_speed:
             color = (0, 0, 0)
         else:
             color = (255, 255, 255)
-        text = self._font.render(format_time(self.time), True, color)
-        surface.blit(text, (0, 0))
+        # format_time() also rounds down to hundredths of a second.
+        key = (int(self.time * 100), color)
+        if key != self._text_key:
+            self._text = self._font.render(format_time(self.time), True, color)
+            self._text_key = key
+        return (self._text, (0, 0))
 
 
 class HighScoreCounter:
 
     MAX_SCORES = 3
-    # The best times will be first in the _scores list.
+    # The _scores list contains only the MAX_SCORES best times, and the
+    # best times are first. heapq.nlargest() keeps it that way without
+    # sorting all of the scores.
 
     def __init__(self, filename):
         self._filename = filename
         self._scores = []   # [(seconds, name), ...]
+        self._file = None   # opened for appending when it's needed
+
+    @staticmethod
+    def _parse(file):
+        for line in file:
+            line = line.strip()
+            if not line:
+                continue
+            seconds, name = line.split('\t', 1)
+            yield (float(seconds), name)
 
     def read(self):
-        self._scores[:] = []
+        # The score file contains every result ever, but only the best
+        # ones are needed. This doesn't put all of them in a list.
         try:
             with io.open(self._filename, 'r') as file:
-                for line in file:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    seconds, name = line.split('\t', 1)
-                    self._scores.append((float(seconds), name))
+                self._scores = heapq.nlargest(
+                    self.MAX_SCORES, self._parse(file))
         except _NoFile:
             # add_result() will create the score file.
-            pass
-        self._scores.sort(reverse=True)     # Best scores first.
+            self._scores = []
 
     def add_result(self, seconds):
         """Add a new high score if it's good enough.
@@ -402,17 +518,22 @@ class HighScoreCounter:
             return
         name = name.strip() or "???"
 
-        self._scores.append((seconds, name))
-        self._scores.sort(reverse=True)
-        with io.open(self._filename, 'a') as f:
-            print('%.4f\t%s' % (seconds, name), file=f)
+        self._scores = heapq.nlargest(
+            self.MAX_SCORES, self._scores + [(seconds, name)])
+        if self._file is None:
+            # The file stays open so it doesn't need to be opened again
+            # for every new high score.
+            self._file = io.open(self._filename, 'a')
+            atexit.register(self._file.close)
+        print('%.4f\t%s' % (seconds, name), file=self._file)
+        self._file.flush()
         return True
 
     def show_scores(self):
         if self._scores:
             text = '\n'.join(
                 format_time(seconds) + '\t' + name
-                for seconds, name in self._scores[:self.MAX_SCORES])
+                for seconds, name in self._scores)
         else:
             text = "There are no high scores yet."
         easygui.msgbox(text, title="High scores")
@@ -420,6 +541,10 @@ class HighScoreCounter:
 
 class BallGame:
 
+    # Every ball makes every frame a bit slower, so there can't be more
+    # balls than this.
+    MAX_BALLS = 64
+
     def __init__(self, screen):
         self.width, self.height = screen.get_size()
         self.double_speed = False
@@ -429,14 +554,140 @@ class BallGame:
         self.scorecounter = HighScoreCounter('scores.txt')
         self.paddle = None
         self.double_speed = False
+        self._ball_sprites = {}     # {(radius, fill): surface, ...}
+        self._paddle_sprites = {}   # {(width, color, border): surface, ...}
+        self._background = None
+        self._drawn_rects = []
+
+        # Looking up the key from a dict is faster than checking it
+        # with a long chain of ifs.
+        # The paddle keys are not here because _handle_events() checks
+        # which keys are held down instead.
+        self._key_actions = dict.fromkeys(_LAUNCH_KEYS, self._launch)
+        self._key_actions.update({
+            pygame.K_h: self.scorecounter.show_scores,
+            pygame.K_F1: self._show_help,
+            pygame.K_F2: self._new_game,
+            pygame.K_q: self._quit,
+        })
+
+    def get_ball_sprite(self, radius, fill):
+        """Return a surface with a ball drawn on it.
+
+        Drawing circles is slow, so they are drawn only once and then
+        blitted to the screen. The surface is 1 pixel bigger than the
+        ball on each side.
+        """
+        try:
+            return self._ball_sprites[(radius, fill)]
+        except KeyError:
+            size = 2*radius + 2
+            sprite = pygame.Surface([size, size], pygame.SRCALPHA)
+            center = [radius + 1, radius + 1]
+            pygame.draw.circle(sprite, fill, center, radius)
+            pygame.draw.circle(sprite, (0, 0, 0), center, radius, 1)
+            sprite = sprite.convert_alpha()
+            self._ball_sprites[(radius, fill)] = sprite
+            return sprite
+
+    def get_paddle_sprite(self, width, color, border):
+        """Like get_ball_sprite(), but for the paddle.
+
+        If border is True, a black border is drawn around the paddle.
+        """
+        try:
+            return self._paddle_sprites[(width, color, border)]
+        except KeyError:
+            sprite = pygame.Surface([width, Paddle.THICKNESS]).convert()
+            sprite.fill(color)
+            if border:
+                pygame.draw.rect(sprite, (0, 0, 0), sprite.get_rect(), 3)
+            self._paddle_sprites[(width, color, border)] = sprite
+            return sprite
 
     def do_random(self):
         """Do crazy things."""
         # This is called by Ball.do_random() when the ball hits a
         # paddle.
-        if random.choice([True, True, False]):
+        # New balls get less likely when there are many balls already.
+        if random.random() < 2/3 * (1 - len(self.balls)/self.MAX_BALLS):
             self.balls.append(Ball(self))
-        self.double_speed = random.choice([False, False, False, True])
+        self.double_speed = _random_bool() and _random_bool()
+
+    def _launch(self):
+        if not self.launched:
+            self.clock.start()
+            self.launched = True
+
+    def _show_help(self):
+        easygui.codebox(title="Ball and paddle", text=__doc__)
+
+    def _new_game(self):
+        # run() quits its loop when there are no balls left.
+        self.balls[:] = []
+
+    def _quit(self):
+        pygame.quit()
+        sys.exit()
+
+    def _draw(self, everything):
+        """Draw the game and update the screen.
+
+        Usually only a small part of the screen changes, so only the
+        areas where something was drawn on this call or the previous
+        call are updated. If everything is True or the background color
+        has changed, the whole screen is drawn and updated instead.
+        """
+        if self.double_speed:
+            background = (255, 0, 0)
+        else:
+            background = (0, 0, 0)
+        if background != self._background:
+            self._background = background
+            everything = True
+
+        if everything:
+            self.screen.fill(background)
+        else:
+            for rect in self._drawn_rects:
+                self.screen.fill(background, rect)
+
+        blits = [self.clock.get_blit(), self.paddle.get_blit()]
+        blits.extend(ball.get_blit() for ball in self.balls)
+        # Blitting everything with one call is faster than calling
+        # blit() once for each thing.
+        rects = self.screen.blits(
+            [pair for pair in blits if pair is not None], True)
+
+        if everything:
+            pygame.display.flip()
+        else:
+            pygame.display.update(self._drawn_rects + rects)
+        self._drawn_rects = rects
+
+    def _handle_events(self):
+        """Check for events and stop the game when needed.
+
+        Return True if there were any events.
+        """
+        got_events = False
+        for event in pygame.event.get():
+            got_events = True
+            if event.type == pygame.KEYDOWN:
+                action = self._key_actions.get(event.key)
+                if action is not None:
+                    action()
+
+            if event.type == pygame.QUIT:
+                self._quit()
+
+        # This is simpler than keeping track of KEYDOWN and KEYUP events,
+        # and it works even if the window missed an event.
+        pressed = pygame.key.get_pressed()
+        right = any(pressed[key] for key in _RIGHT_KEYS)
+        left = any(pressed[key] for key in _LEFT_KEYS)
+        self.paddle.direction = right - left
+        return got_events
 
     def run(self):
         assert not self.balls, "cannot run twice at the same time"
@@ -447,71 +698,41 @@ class BallGame:
         self.launched = False
         self.double_speed = False
 
+        # The previous game or a dialog may have been on top of the
+        # window, so everything needs to be drawn at first.
+        redraw_everything = True
         while self.balls:
             self.clock.wait()
-
+            # Handling the events first makes the game respond to key
+            # presses one frame faster.
+            if self._handle_events():
+                # The event may have changed something, or a dialog
+                # may have been on top of the window. Events don't
+                # happen often, so drawing everything is fine.
+                redraw_everything = True
+
+            old_paddle_x = self.paddle.x
             self.paddle.move()
-            for ball in self.balls:
-                ball.move()
-
-            for ball in self.balls[:]:
-                if self.launched:
-                    if ball.y > self.height + ball.radius:
-                        # too low
-                        self.balls.remove(ball)
-                else:
-                    # center the ball on the paddle
-                    ball.x = self.paddle.x
-
-            if self.double_speed:
-                self.screen.fill((255, 0, 0))
+            if self.launched:
+                for ball in self.balls:
+                    ball.move()
+                # Forget the balls that went too low. This is faster
+                # than removing them one by one.
+                self.balls = [ball for ball in self.balls
+                              if ball.y <= self.height + ball.radius]
+                for ball in self.balls:
+                    ball.hitcheck()
             else:
-                self.screen.fill(0)
-            self.clock.draw(self.screen)
-            self.paddle.draw(self.screen)
-            for ball in self.balls:
-                ball.draw(self.screen)
-            pygame.display.flip()
+                # center the ball on the paddle
+                for ball in self.balls:
+                    ball.x = self.paddle.x
 
-            # Check for events and stop game when needed.
-            for event in pygame.event.get():
-                if event.type == pygame.KEYDOWN:
-                    if event.key in {pygame.K_LEFT, pygame.K_a}:
-                        self.paddle.direction = -1
-                    if event.key in {pygame.K_RIGHT, pygame.K_d}:
-                        self.paddle.direction = 1
-                    if event.key in {pygame.K_SPACE, pygame.K_RETURN,
-                                     pygame.K_UP, pygame.K_w}:
-                        # Launch.
-                        if not self.launched:
-                            self.clock.start()
-                            self.launched = True
-                    if event.key == pygame.K_h:
-                        self.scorecounter.show_scores()
-                    if event.key == pygame.K_F1:
-                        easygui.codebox(title="Ball and paddle",
-                                        text=__doc__)
-                    if event.key == pygame.K_F2:
-                        # Start a new game by quitting this loop.
-                        self.balls[:] = []
-                    if event.key == pygame.K_q:
-                        pygame.quit()
-                        sys.exit()
-
-                if event.type == pygame.KEYUP:
-                    if event.key in {pygame.K_LEFT, pygame.K_a}:
-                        if self.paddle.direction == -1:
-                            self.paddle.direction = 0
-                    if event.key in {pygame.K_RIGHT, pygame.K_d}:
-                        if self.paddle.direction == 1:
-                            self.paddle.direction = 0
-
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
-
-            for ball in self.balls:
-                ball.hitcheck()
+            # Nothing moves or blinks before the ball is launched, so
+            # there's no need to draw the same thing again and again.
+            if (self.launched or self.paddle.x != old_paddle_x or
+                    redraw_everything):
+                self._draw(redraw_everything)
+                redraw_everything = False
 
         self.clock.stop()
         if self.scorecounter.add_result(self.clock.time):
@@ -521,8 +742,24 @@ class BallGame:
 def main():
     pygame.init()
     pygame.font.init()
-    screen = pygame.display.set_mode([800, 600])
+    try:
+        # With pygame 2, the window contents are shown with a hardware
+        # accelerated renderer and screen updates are synced with the
+        # monitor.
+        screen = pygame.display.set_mode(
+            [800, 600], pygame.SCALED | pygame.DOUBLEBUF, vsync=1)
+    except (AttributeError, TypeError, pygame.error):
+        # Old pygame or SDL.
+        screen = pygame.display.set_mode([800, 600])
     pygame.display.set_caption("Ball and paddle")
+    # The game doesn't care about mouse events and other things like
+    # that, so there's no need to go through them. Key releases aren't
+    # needed either because the paddle keys are checked with
+    # pygame.key.get_pressed(). VIDEOEXPOSE tells
+    # the game to redraw when a dialog was on top of the window.
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed([pygame.KEYDOWN, pygame.QUIT,
+                              pygame.VIDEOEXPOSE])
     game = BallGame(screen)
     game.scorecounter.read()
     while True: